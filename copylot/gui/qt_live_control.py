@@ -1,6 +1,5 @@
-from PyQt5.QtWidgets import QWidget, QApplication, QComboBox, QPushButton, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QComboBox, QPushButton, QVBoxLayout
 from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
-import time
 
 from copylot.gui.qt_nidaq_worker import NIDaqWorker
 
@@ -18,6 +17,7 @@ class LiveControl(QWidget):
 
         self.state_tracker = False  # tracks if live mode is on
         self.wait_shutdown = False
+        self.pending_launch = False  # relaunch requested while previous worker shuts down
 
         self.layout = QVBoxLayout()
         self.layout.setAlignment(Qt.AlignTop)
@@ -51,11 +51,10 @@ class LiveControl(QWidget):
             self.trigger_stop_live.emit()  # does nothing on first iteration before thread is made.
             # Stops thread before new one is launched. Needed when instanced on parameter change.
 
-            while True:
-                time.sleep(0.05)
-                if not self.wait_shutdown:
-                    break
-                QApplication.processEvents()
+            # defer the launch to update_wait_shutdown instead of blocking the event loop
+            if self.wait_shutdown:
+                self.pending_launch = True
+                return
             self.wait_shutdown = True  # reset to true for next call
 
             daq_card_worker = NIDaqWorker(
@@ -81,11 +80,6 @@ class LiveControl(QWidget):
 
             self.threadpool.start(daq_card_worker)
 
-            # because processEvents runs while waiting for wait_shutdown = False, if pressed quickly, live mode can
-            # emit final trigger_stop_live.emit before final worker is initialized, preventing a proper shutdown.
-            if not self.state_tracker:
-                self.trigger_stop_live.emit()
-
     def handle_nidaq_launch(self):
         self.state_tracker = not self.state_tracker
 
@@ -100,6 +94,13 @@ class LiveControl(QWidget):
 
     def update_wait_shutdown(self):
         self.wait_shutdown = False
+        # launch the worker requested while the previous one was still shutting down
+        if self.pending_launch:
+            self.pending_launch = False
+            if self.state_tracker:
+                self.launch_nidaq()
+                return
+
         # reset to idle status is here to prevent 'running' displaying if live mode exited while spinbox is selected
         if not self.state_tracker:
             self.parent.status_bar.showMessage("NIDaq idle...")
@@ -158,13 +158,19 @@ class TextboxAndSlider(QWidget):
             self.max_input_line.setText("NaN")
         pass
 
+    # signals are blocked while syncing so a drag does not echo back through the partner widget
+
     @pyqtSlot(float)
     def float_to_scaled_int(self, value):
+        self.slider.blockSignals(True)
         self.slider.setValue(int(value * self._max_int))
+        self.slider.blockSignals(False)
 
     @pyqtSlot(int)
     def int_to_scaled_float(self, value):
+        self.spinbox.blockSignals(True)
         self.spinbox.setValue(float(value / self._max_int))
+        self.spinbox.blockSignals(False)
 
     def mouseReleaseEvent(self, event):
         self.parent.parent.live_widget.launch_nidaq()
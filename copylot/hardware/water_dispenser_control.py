@@ -11,54 +11,71 @@ mc          : set signal to srs
 (enter key) : display present settings
 """
 
+from contextlib import contextmanager
+
 import serial
 import time
 
 
 class WaterDispenserControl:
+    RESPONSE_TIMEOUT = 1  # unit: second, longest wait for the pump to answer a command
+
     def __init__(self, com, baudrate):
         self.stop_now = False
         self.com = com
         self.baudrate = baudrate
+        self.ser = None  # connection shared by all commands during run_for_recording
+
+    @contextmanager
+    def _connection(self):
+        """yield the shared serial connection, or open a new one for a single command"""
+        if self.ser is not None:
+            yield self.ser
+            return
 
-    def set_pump_speed(self, freq: int, amp: int):
-        """set the speed for pump by setting the frequency and amplitude"""
         ser = serial.Serial(self.com, self.baudrate, timeout=5)
         if ser.is_open:
             ser.close()
         ser.open()
-        message_freq = b"f" + bytearray(str(freq), "utf-8") + b"\r"
-        print(message_freq)
-        ser.write(message_freq)
-        time.sleep(1)  # allow the pump to respond to previous command
-        message_amp = b"a" + bytearray(str(amp), "utf-8") + b"\r"
-        print(message_amp)
-        ser.write(message_amp)
-        ser.close()
+        try:
+            yield ser
+        finally:
+            ser.close()
+
+    def _send_command(self, ser, message):
+        """write a command and wait until the pump answers, at most RESPONSE_TIMEOUT"""
+        ser.reset_input_buffer()
+        ser.write(message)
+        timeout = ser.timeout
+        ser.timeout = self.RESPONSE_TIMEOUT
+        ser.read_until(b"\r")
+        ser.timeout = timeout
+
+    def set_pump_speed(self, freq: int, amp: int):
+        """set the speed for pump by setting the frequency and amplitude"""
+        with self._connection() as ser:
+            message_freq = b"f" + bytearray(str(freq), "utf-8") + b"\r"
+            print(message_freq)
+            self._send_command(ser, message_freq)
+            message_amp = b"a" + bytearray(str(amp), "utf-8") + b"\r"
+            print(message_amp)
+            self._send_command(ser, message_amp)
 
     def run_pump(self, duration: float):
         """start pump for the duration and then stop"""
-        ser = serial.Serial(self.com, self.baudrate, timeout=5)
-        if ser.is_open:
-            ser.close()
-        ser.open()
-        print("start dispensing water")
-        ser.write(b"bon\r")
-        time.sleep(duration)
-        ser.write(b"boff\r")
-        print("stop dispensing water")
-        ser.close()
+        with self._connection() as ser:
+            print("start dispensing water")
+            ser.write(b"bon\r")
+            time.sleep(duration)
+            ser.write(b"boff\r")
+            print("stop dispensing water")
 
     def read_pump(self):
         """read out the current status and print"""
-        ser = serial.Serial(self.com, self.baudrate, timeout=5)
-        if ser.is_open:
-            ser.close()
-        ser.open()
-        ser.write(b"\r")
-        message = ser.read(100)
-        print(message.decode("utf-8"))
-        ser.close()
+        with self._connection() as ser:
+            ser.write(b"\r")
+            message = ser.read(100)
+            print(message.decode("utf-8"))
 
     def run_for_recording(self, interval: float, duration: float, freq: int, amp: int):
         """run the pump for a recording session
@@ -71,8 +88,13 @@ class WaterDispenserControl:
         if waittime <= 0:
             raise ValueError("interval is shorter than duration")
 
-        self.set_pump_speed(freq, amp)  # set the pump speed
-        time.sleep(1)
-        while not self.stop_now:
-            self.run_pump(duration)
-            time.sleep(waittime)
+        # keep one connection open for the whole session instead of reopening the port per command
+        with self._connection() as ser:
+            self.ser = ser
+            try:
+                self.set_pump_speed(freq, amp)  # set the pump speed
+                while not self.stop_now:
+                    self.run_pump(duration)
+                    time.sleep(waittime)
+            finally:
+                self.ser = None